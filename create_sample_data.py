@@ -8,8 +8,18 @@ This script creates a sample Excel file with the structure required for the Gant
 import pandas as pd
 import numpy as np
 
-def create_sample_data(output_file="sample_tasks.xlsx"):
+# Month column headers for each supported month format
+MONTH_NAMES = {
+    'full': ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August',
+             'September', 'October', 'November', 'December'],
+    'short': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
+}
+
+def create_sample_data(output_file="sample_tasks.xlsx", month_format='full'):
     """Create a sample Excel file with task data."""
+    if month_format not in MONTH_NAMES:
+        raise ValueError(f"Unknown month format: {month_format} (expected 'full' or 'short')")
+    
     # Define sample data
     data = {
         'Task': [
@@ -40,57 +50,28 @@ def create_sample_data(output_file="sample_tasks.xlsx"):
         ],
     }
     
-    # Add month columns (January to December)
-    months = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']
-    
-    # Initialize all month values to empty
-    for month in months:
-        data[month] = ['' for _ in range(len(data['Task']))]
-    
-    # Set task durations across months
-    # Project Planning: January-February
-    data['January'][0] = 'X'
-    data['February'][0] = 'X'
-    
-    # Requirements Gathering: February-March
-    data['February'][1] = 'X'
-    data['March'][1] = 'X'
-    
-    # System Design: March-April
-    data['March'][2] = 'X'
-    data['April'][2] = 'X'
-    
-    # Development Phase 1: April-June
-    data['April'][3] = 'X'
-    data['May'][3] = 'X'
-    data['June'][3] = 'X'
-    
-    # Development Phase 2: June-August
-    data['June'][4] = 'X'
-    data['July'][4] = 'X'
-    data['August'][4] = 'X'
-    
-    # Testing: August-September
-    data['August'][5] = 'X'
-    data['September'][5] = 'X'
-    
-    # Deployment: October
-    data['October'][6] = 'X'
-    
-    # Training: October-November
-    data['October'][7] = 'X'
-    data['November'][7] = 'X'
-    
-    # Documentation: September-November
-    data['September'][8] = 'X'
-    data['October'][8] = 'X'
-    data['November'][8] = 'X'
+    # Task durations as (start month, end month), in the same order as the tasks
+    durations = [
+        (1, 2),    # Project Planning: January-February
+        (2, 3),    # Requirements Gathering: February-March
+        (3, 4),    # System Design: March-April
+        (4, 6),    # Development Phase 1: April-June
+        (6, 8),    # Development Phase 2: June-August
+        (8, 9),    # Testing: August-September
+        (10, 10),  # Deployment: October
+        (10, 11),  # Training: October-November
+        (9, 11),   # Documentation: September-November
+        (12, 12),  # Post-Launch Review: December
+    ]
     
-    # Post-Launch Review: December
-    data['December'][9] = 'X'
+    # Mark the months of each task with 'X', leaving the other months empty
+    months = MONTH_NAMES[month_format]
+    month_values = np.full((len(durations), len(months)), '', dtype=object)
+    for i, (start_month, end_month) in enumerate(durations):
+        month_values[i, start_month - 1:end_month] = 'X'
     
     # Create DataFrame
-    df = pd.DataFrame(data)
+    df = pd.concat([pd.DataFrame(data), pd.DataFrame(month_values, columns=months)], axis=1)
     
     # Save to Excel
     df.to_excel(output_file, index=False)
@@ -9,12 +9,23 @@ with formatting to represent the Gantt chart visually.
 import pandas as pd
 import argparse
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 import numpy as np
-from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Border, Side, Alignment, Font, Color
-from openpyxl.utils import get_column_letter
+import xlsxwriter
+from openpyxl import load_workbook
 import json
+from collections import defaultdict
+
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+
+# Task sheet columns read_excel_data keeps from each openpyxl row
+INPUT_COLUMNS = {'Task', 'Task 1', 'Business Driver', 'Resources', 'Data', 'Location', *MONTH_NAMES}
+
+# Formats for header rows, resource group rows and zebra summary rows
+HEADER_FORMAT = {'bold': True, 'align': 'center', 'bg_color': '#DDDDDD', 'pattern': 1}
+GROUP_FORMAT = {'bold': True, 'bg_color': '#EEEEEE', 'pattern': 1}
+ZEBRA_FORMAT = {'bg_color': '#F5F5F5', 'pattern': 1}
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -29,7 +40,23 @@ def read_excel_data(file_path):
         raise FileNotFoundError(f"Input file not found: {file_path}")
     
     try:
-        df = pd.read_excel(file_path)
+        # Stream the rows in read-only mode so cell styles are never loaded
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            # Read the first sheet like pd.read_excel; the stored dimension can
+            # be missing or stale, so let openpyxl recompute it from the cells
+            ws = wb.worksheets[0]
+            ws.reset_dimensions()
+            rows = ws.iter_rows(values_only=True)
+            header = next(rows, ())
+            
+            # Keep only the columns the export uses; rows can be shorter than
+            # the header when their trailing cells are empty
+            keep = [i for i, col in enumerate(header) if col in INPUT_COLUMNS]
+            df = pd.DataFrame([[row[i] if i < len(row) else None for i in keep] for row in rows],
+                              columns=[header[i] for i in keep])
+        finally:
+            wb.close()
         
         # Map expected column names to actual column names
         expected_columns = {
@@ -51,10 +78,7 @@ def read_excel_data(file_path):
             raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
         
         # Check for month columns - using full month names
-        full_month_names = ['January', 'February', 'March', 'April', 'May', 'June', 
-                           'July', 'August', 'September', 'October', 'November', 'December']
-        
-        month_columns = [col for col in df.columns if col in full_month_names]
+        month_columns = [col for col in df.columns if col in MONTH_NAMES]
         if not month_columns:
             raise ValueError("No month columns found (January-December)")
         
@@ -66,148 +90,130 @@ def process_data_for_gantt(df):
     """Process the Excel data into a format suitable for Gantt chart."""
     current_year = datetime.now().year
     
-    # Create a list to store task data
-    tasks = []
-    
-    # Month to number mapping using full month names
-    month_to_num = {
-        'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
-        'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12
-    }
-    
-    # Process each row
-    for _, row in df.iterrows():
-        task_name = row['Task']
-        resource = row['Resources']  # Note: using 'Resources' instead of 'Resource'
-        location = row['Location']
-        driver = row.get('Business Driver', '')  # Use get to handle missing column
-        task1 = row.get('Task 1', '')  # Get Task 1 value
-        data = row.get('Data', '')  # Get Data value
-        
-        # Find start and end months
-        start_month = None
-        end_month = None
-        duration = 0
-        
-        for month in month_to_num.keys():
-            if month in df.columns and pd.notna(row[month]) and row[month]:
-                if start_month is None:
-                    start_month = month_to_num[month]
-                end_month = month_to_num[month]
-                duration += 1
-        
-        # Skip if no duration
-        if start_month is None or end_month is None:
-            continue
-        
-        # Create start and end dates
-        start_date = datetime(current_year, start_month, 1)
-        # End date is the last day of the end month
-        if end_month == 12:
-            end_date = datetime(current_year, 12, 31)
-        else:
-            end_date = datetime(current_year, end_month + 1, 1) - timedelta(days=1)
-        
-        # Use Task 1 as the primary identifier, fallback to Task if Task 1 is empty
-        display_name = task1 if pd.notna(task1) and task1 else task_name
-        
-        # Create a combined key for Resource, Driver, Location
-        resource_key = f"{resource} | {driver} | {location}"
-        
-        # Add task to the list
-        tasks.append({
-            'Task': task_name,
-            'Task 1': task1,
-            'Display_Name': display_name,  # New field for display purposes
-            'Resource': resource,
-            'Location': location,
-            'Driver': driver,
-            'Data': data,
-            'ResourceKey': resource_key,  # Combined key for grouping
-            'Start': start_date,
-            'Finish': end_date,
-            'Duration': duration,
-            'Start_Month': start_month,
-            'End_Month': end_month
-        })
-    
-    return pd.DataFrame(tasks)
+    # Build an (N, 12) boolean matrix of active months; missing month columns
+    # are reindexed in as empty so column i is always month i + 1. Any value
+    # marks a month as active except an explicit FALSE cell
+    month_cells = df.reindex(columns=MONTH_NAMES)
+    mask = month_cells.notna().to_numpy(copy=True)
+    
+    # Only cells equal to False can be FALSE markers; of those, 0 and 0.0
+    # stay active and only real booleans are cleared, whatever the column dtype
+    values = month_cells.to_numpy(dtype=object)
+    row_idx, col_idx = np.nonzero(mask & (values == False))
+    mask[row_idx, col_idx] = [not isinstance(values[i, j], (bool, np.bool_)) for i, j in zip(row_idx, col_idx)]
+    
+    # Find start and end months and the number of active months per row
+    duration = mask.sum(axis=1)
+    start_month = mask.argmax(axis=1) + 1
+    end_month = 12 - mask[:, ::-1].argmax(axis=1)
+    
+    # Skip rows without any active month
+    keep = duration > 0
+    rows = df[keep]
+    duration = duration[keep]
+    start_month = start_month[keep]
+    end_month = end_month[keep]
+    
+    task_name = rows['Task']
+    resource = rows['Resources']  # Note: using 'Resources' instead of 'Resource'
+    location = rows['Location']
+    empty = pd.Series('', index=rows.index)
+    driver = rows.get('Business Driver', empty)  # Use get to handle missing column
+    task1 = rows.get('Task 1', empty)  # Get Task 1 value
+    data = rows.get('Data', empty)  # Get Data value
+    
+    # Create start and end dates; the end date is the last day of the end month
+    start_date = pd.to_datetime(pd.DataFrame({'year': current_year, 'month': start_month, 'day': 1}))
+    end_date = pd.to_datetime(pd.DataFrame({'year': current_year, 'month': end_month, 'day': 1}))
+    end_date = end_date + pd.offsets.MonthEnd(0)
+    
+    # Use Task 1 as the primary identifier, fallback to Task if Task 1 is empty
+    display_name = task1.where(task1.notna() & (task1 != ''), task_name)
+    
+    return pd.DataFrame({
+        'Task': task_name.to_numpy(),
+        'Task 1': task1.to_numpy(),
+        'Display_Name': display_name.to_numpy(),  # New field for display purposes
+        'Resource': resource.to_numpy(),
+        'Location': location.to_numpy(),
+        'Driver': driver.to_numpy(),
+        'Data': data.to_numpy(),
+        'Start': start_date.to_numpy(),
+        'Finish': end_date.to_numpy(),
+        'Duration': duration,
+        'Start_Month': start_month,
+        'End_Month': end_month
+    })
+
+def month_masks(df_tasks):
+    """Encode the months of each task as a 12-bit mask, bit 0 being January."""
+    start_bits = df_tasks['Start_Month'].to_numpy().astype(np.int16) - 1
+    end_bits = df_tasks['End_Month'].to_numpy().astype(np.int16)
+    return (np.left_shift(1, end_bits) - np.left_shift(1, start_bits)).tolist()
 
-def calculate_resource_percentage(df_tasks, task):
-    """Calculate the percentage of unique resource months spent on a task."""
-    resource = task['Resource']
-    
-    # Get all tasks for this resource
-    resource_tasks = df_tasks[df_tasks['Resource'] == resource]
-    
-    # Calculate total unique resource-months
-    total_resource_months = len(set([
-        (t['Resource'], m) 
-        for _, t in resource_tasks.iterrows() 
-        for m in range(t['Start_Month'], t['End_Month'] + 1)
-    ]))
-    
-    # Calculate unique resource-months for this task
-    task_resource_months = len(set([
-        (resource, m) 
-        for m in range(task['Start_Month'], task['End_Month'] + 1)
-    ]))
-    
-    # Calculate percentage
-    return (task_resource_months / total_resource_months) * 100 if total_resource_months > 0 else 0
 
+def count_months(mask):
+    """Count the months set in a 12-bit month mask."""
+    return bin(mask).count('1')
 
-def calculate_task1_percentages(df_tasks, display_color_map):
+
+def calculate_resource_months(df_tasks):
+    """Collect the month mask each resource is busy in, across all of its tasks."""
+    resource_months = {}
+    for resource, mask in zip(df_tasks['Resource'], month_masks(df_tasks)):
+        resource_months[resource] = resource_months.get(resource, 0) | mask
+    return resource_months
+
+
+def calculate_task1_percentages(df_tasks, sorted_displays, resource_months):
     """Calculate percentages of unique resource months for each Task 1 (Display_Name)."""
-    task1_resource_months = {}
-    total_resource_months_by_display = {}
-    task1_percentages = {}
+    # Collect the month mask of each resource used by a display name in one pass
+    display_resource_months = defaultdict(dict)
+    for display_name, resource, mask in zip(df_tasks['Display_Name'], df_tasks['Resource'], month_masks(df_tasks)):
+        resource_masks = display_resource_months[display_name]
+        resource_masks[resource] = resource_masks.get(resource, 0) | mask
     
-    # First, calculate total unique resource-months for each display name
-    for display_name in sorted(display_color_map.keys()):
-        tasks_with_display = df_tasks[df_tasks['Display_Name'] == display_name]
-        
-        # Get all resources used by this display name
-        resources = tasks_with_display['Resource'].unique()
-        
-        # For each resource, get all tasks with that resource
-        all_resource_months = set()
-        task_resource_months = set()
-        
-        for resource in resources:
-            resource_tasks = df_tasks[df_tasks['Resource'] == resource]
-            
-            # Add all resource-month pairs to the set
-            for _, t in resource_tasks.iterrows():
-                for m in range(t['Start_Month'], t['End_Month'] + 1):
-                    all_resource_months.add((t['Resource'], m))
-            
-            # Add resource-month pairs for this display name to the set
-            for _, t in tasks_with_display[tasks_with_display['Resource'] == resource].iterrows():
-                for m in range(t['Start_Month'], t['End_Month'] + 1):
-                    task_resource_months.add((t['Resource'], m))
+    task1_percentages = {}
+    for display_name in sorted_displays:
+        resource_masks = display_resource_months[display_name]
         
-        # Store the counts
-        task1_resource_months[display_name] = len(task_resource_months)
-        total_resource_months_by_display[display_name] = len(all_resource_months)
+        # Total unique resource-months of every resource used by this display name
+        total_months = sum(count_months(resource_months.get(resource, 0)) for resource in resource_masks)
         
         # Calculate percentage
-        task_months = task1_resource_months.get(display_name, 0)
-        total_months = total_resource_months_by_display.get(display_name, 0)
+        task_months = sum(count_months(mask) for mask in resource_masks.values())
         task1_percentages[display_name] = (task_months / total_months) * 100 if total_months > 0 else 0
     
     return task1_percentages
 
 
+def join_unique(values):
+    """Join the sorted distinct non-empty values as a comma separated string."""
+    return ', '.join(sorted({str(value) for value in values if pd.notna(value)} - {''}))
+
+
+def column_width(values, header):
+    """Return the width for a column from its header and values, at least 10."""
+    lengths = values.dropna().astype(str).str.len()
+    max_length = max(len(header), lengths.max() if len(lengths) else 0)
+    return max(max_length + 2, 10)
+
+
+def set_column_widths(ws, widths):
+    """Apply the precomputed column widths to a worksheet."""
+    for col, width in enumerate(widths):
+        ws.set_column(col, col, width)
+
+
 def create_excel_gantt(df_tasks, output_file):
     """Create an Excel file with Gantt chart representation."""
-    # Create a new workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Gantt Chart"
+    # Create a new workbook; constant_memory flushes each row to disk once the
+    # next one starts, so rows must be written in increasing order
+    wb = xlsxwriter.Workbook(output_file, {'constant_memory': True, 'strings_to_numbers': False})
+    ws = wb.add_worksheet("Gantt Chart")
     
     # Sort tasks by Resource, Driver, Location, and Start date
-    df_tasks = df_tasks.sort_values(by=['Resource', 'Driver', 'Location', 'Start'])
+    df_tasks = df_tasks.sort_values(by=['Resource', 'Driver', 'Location', 'Start'], kind='mergesort')
     
     # Define colors directly based on Display_Name (which is Task 1 or Task if Task 1 is empty)
     display_names = df_tasks['Display_Name'].unique()
@@ -217,175 +223,195 @@ def create_excel_gantt(df_tasks, output_file):
         "8C564B", "E377C2", "7F7F7F", "BCBD22", "17BECF"
     ]
     
-    # Create color map based on Display_Name (Task 1 values)
+    # Create color map based on Display_Name (Task 1 values); the sorted names
+    # are reused for the legend
+    sorted_displays = sorted(display_names)
     display_color_map = {}
-    for i, name in enumerate(sorted(display_names)):
+    for i, name in enumerate(sorted_displays):
         display_color_map[name] = colors[i % len(colors)]
     
+    # Create each format once; bars get a plain and a labelled format per Task 1 value
+    header_fmt = wb.add_format(HEADER_FORMAT)
+    group_fmt = wb.add_format(GROUP_FORMAT)
+    zebra_fmt = wb.add_format(ZEBRA_FORMAT)
+    fmt_by_display = {name: wb.add_format({'bg_color': f"#{color}", 'pattern': 1})
+                      for name, color in display_color_map.items()}
+    label_fmt_by_display = {name: wb.add_format({'bg_color': f"#{color}", 'pattern': 1, 'bold': True,
+                                                 'font_color': '#FFFFFF', 'align': 'left'})
+                            for name, color in display_color_map.items()}
+    
     # Month headers - using full month names
-    month_headers = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
+    month_headers = MONTH_NAMES
     
     # Set up headers
     headers = ["Resource", "Driver", "Location"]
     
     # Write headers
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col)
-        cell.value = header
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal='center')
-        cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-    
-    # Write month headers
-    for col, month in enumerate(month_headers, len(headers) + 1):
-        cell = ws.cell(row=1, column=col)
-        cell.value = month
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal='center')
-        cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-    
-    # Group by ResourceKey (Resource | Driver | Location)
-    row_idx = 2
-    current_resource_key = None
+    ws.write_row(0, 0, headers + month_headers, header_fmt)
+    
+    # Collect the unique months of each resource once for the bar and legend percentages
+    resource_months = calculate_resource_months(df_tasks)
+    resource_totals = {resource: count_months(mask) for resource, mask in resource_months.items()}
+    
+    # Label each bar as "Task 1 Name (XX%)", the percentage of unique resource months
+    percentage = ((df_tasks['End_Month'] - df_tasks['Start_Month'] + 1)
+                  / df_tasks['Resource'].map(resource_totals) * 100)
+    df_tasks['Bar_Label'] = (df_tasks['Display_Name'].astype(str) + ' ('
+                             + percentage.round().astype(int).astype(str) + '%)')
+    
+    # Compute column widths from the data; a month column holds the labels of
+    # the bars starting in that month
+    label_lengths = df_tasks['Bar_Label'].str.len().groupby(df_tasks['Start_Month']).max()
+    gantt_widths = [column_width(df_tasks[col], header)
+                    for col, header in zip(['Resource', 'Driver', 'Location'], headers)]
+    gantt_widths += [max(len(month) + 2, label_lengths.get(month_num, 0) + 2, 10)
+                     for month_num, month in enumerate(month_headers, 1)]
+    set_column_widths(ws, gantt_widths)
+    
+    # Group by Resource, Driver and Location. df_tasks is already sorted by
+    # these columns, so each group is a run of equal keys; the runs are found by
+    # comparing factorized key codes (missing values get a code of their own)
+    group_columns = ['Resource', 'Driver', 'Location']
+    key_codes = np.column_stack([pd.factorize(df_tasks[col], use_na_sentinel=False)[0] for col in group_columns])
+    group_starts = np.flatnonzero(np.any(key_codes[1:] != key_codes[:-1], axis=1)) + 1
+    group_bounds = [0, *group_starts.tolist(), len(df_tasks)] if len(df_tasks) else []
+    
+    # The bar loop reads plain lists instead of per-group DataFrames
+    group_keys = df_tasks[group_columns].to_numpy(dtype=object).tolist()
+    task_names = df_tasks['Display_Name'].tolist()
+    task_starts = df_tasks['Start_Month'].tolist()
+    task_ends = df_tasks['End_Month'].tolist()
+    task_labels = df_tasks['Bar_Label'].tolist()
+    row_idx = 1
+    
+    # Bind the names used per cell as locals so the write loop avoids global
+    # and attribute lookups
+    write = ws.write
+    write_row = ws.write_row
+    merge_range = ws.merge_range
+    fmt_map = fmt_by_display
+    label_fmt_map = label_fmt_by_display
+    hdr_off = len(headers)
+    month_count = len(month_headers)
     
     # Process each resource group
-    for resource_key, group in df_tasks.groupby('ResourceKey'):
-        resource, driver, location = resource_key.split(' | ')
+    for first, last in zip(group_bounds[:-1], group_bounds[1:]):
+        resource, driver, location = ['' if pd.isna(value) else str(value) for value in group_keys[first]]
         
         # No blank rows between resource groups
         
         # Write the resource, driver, location in the first columns
-        ws.cell(row=row_idx, column=1).value = resource
-        ws.cell(row=row_idx, column=2).value = driver
-        ws.cell(row=row_idx, column=3).value = location
+        write_row(row_idx, 0, [resource, driver, location], group_fmt)
         
-        # Add background color to the resource info cells
-        for col in range(1, 4):
-            cell = ws.cell(row=row_idx, column=col)
-            cell.fill = PatternFill(start_color="EEEEEE", end_color="EEEEEE", fill_type="solid")
-            cell.font = Font(bold=True)
+        # Month slots are filled in by the tasks of this resource group
+        month_values = [None] * month_count
+        month_fmts = [None] * month_count
+        month_owners = [None] * month_count
         
         # For each task in this resource group, add bars in the month columns
-        for _, task in group.iterrows():
-            # For each month in the task's duration
-            for month_idx in range(task['Start_Month'], task['End_Month'] + 1):
-                col_idx = month_idx + len(headers)  # Adjust column index for month
-                
-                # Add the task to the cell
-                cell = ws.cell(row=row_idx, column=col_idx)
-                
-                # Color based on Display_Name (Task 1 value)
-                cell.fill = PatternFill(start_color=display_color_map[task['Display_Name']], 
-                                       end_color=display_color_map[task['Display_Name']], 
-                                       fill_type="solid")
-                
-                # Add Display_Name (Task 1) with percentage to the first cell of the bar
-                if month_idx == task['Start_Month']:
-                    # Calculate percentage of unique resource months for this task
-                    percentage = calculate_resource_percentage(df_tasks, task)
-                    
-                    # Format as "Task 1 Name (XX%)"
-                    display_text = f"{task['Display_Name']} ({percentage:.0f}%)"
-                    
-                    cell.value = display_text
-                    cell.alignment = Alignment(horizontal='left')
-                    cell.font = Font(color="FFFFFF", bold=True)
+        for i in range(first, last):
+            # Look up the task's name and formats once for all of its months
+            display_name = task_names[i]
+            bar_fmt = fmt_map[display_name]
+            label_fmt = label_fmt_map[display_name]
+            start_slot = task_starts[i] - 1
+            
+            # Add Display_Name (Task 1) with percentage to the first cell of the bar
+            month_values[start_slot] = task_labels[i]
+            month_fmts[start_slot] = label_fmt
+            month_owners[start_slot] = display_name
+            
+            # Color the remaining months based on Display_Name (Task 1 value);
+            # a month that keeps an earlier bar's label is repainted in this color
+            for slot in range(start_slot + 1, task_ends[i]):
+                month_owners[slot] = display_name
+                month_fmts[slot] = bar_fmt if month_values[slot] is None else label_fmt
+        
+        # Write each run of same-colored months as one merged bar. A run stops at
+        # the next label, so overlapping bars never produce overlapping ranges
+        slot = 0
+        while slot < month_count:
+            owner = month_owners[slot]
+            end = slot + 1
+            if owner is not None:
+                while end < month_count and month_owners[end] == owner and month_values[end] is None:
+                    end += 1
+                if end - slot > 1:
+                    merge_range(row_idx, hdr_off + slot, row_idx, hdr_off + end - 1,
+                                month_values[slot], month_fmts[slot])
+                else:
+                    write(row_idx, hdr_off + slot, month_values[slot], month_fmts[slot])
+            slot = end
         
         row_idx += 1
     
     # Add a summary sheet
-    ws_summary = wb.create_sheet(title="Resource Summary")
-    
-    # Create a summary table by resource, driver, location
-    # Make sure to handle empty values properly
-    resource_summary = df_tasks.groupby(['Resource', 'Driver', 'Location']).agg(
-        Tasks=('Task', lambda x: ', '.join(sorted(set(x)))),
-        Task1=('Task 1', lambda x: ', '.join(sorted(set([str(i) for i in x if pd.notna(i) and i != ''])))),
-        Data=('Data', lambda x: ', '.join(sorted(set([str(i) for i in x if pd.notna(i) and i != ''])))),
-        Task_Count=('Task', 'count'),
-        Total_Duration=('Duration', 'sum'),
-        Months=('Task', lambda x: ', '.join([month_headers[m-1] for m in sorted(set(
-            [month for task_idx, task in df_tasks[df_tasks['Task'].isin(x)].iterrows() 
-             for month in range(task['Start_Month'], task['End_Month']+1)]))]))
-    ).reset_index()
-    
-    # Replace 'nan' strings with empty strings
-    for col in ['Task1', 'Data']:
-        resource_summary[col] = resource_summary[col].str.replace('nan', '').str.strip(', ')
-        # Also handle cases where the string starts or ends with a comma
-        resource_summary[col] = resource_summary[col].str.strip(', ')
+    ws_summary = wb.add_worksheet("Resource Summary")
+    
+    # Create a summary table by resource, driver, location. The text columns
+    # join each group's distinct values from groupby's unique()
+    grouped = df_tasks.groupby(group_columns)
+    resource_summary = pd.concat({
+        'Tasks': grouped['Task'].unique().map(lambda values: ', '.join(sorted(values))),
+        'Task1': grouped['Task 1'].unique().map(join_unique),
+        'Data': grouped['Data'].unique().map(join_unique),
+        'Task_Count': grouped['Task'].count(),
+        'Total_Duration': grouped['Duration'].sum()
+    }, axis=1)
+    
+    # Months covered by each group, OR-reduced from an (N, 12) task month matrix
+    month_nums = np.arange(1, 13)
+    month_mask = ((month_nums >= df_tasks['Start_Month'].to_numpy()[:, None])
+                  & (month_nums <= df_tasks['End_Month'].to_numpy()[:, None]))
+    group_index = pd.MultiIndex.from_frame(df_tasks[group_columns])
+    group_mask = pd.DataFrame(month_mask, index=group_index).groupby(level=[0, 1, 2]).any()
+    resource_summary['Months'] = pd.Series(
+        [', '.join(month for month, active in zip(month_headers, row) if active) for row in group_mask.to_numpy()],
+        index=group_mask.index, dtype=object)
+    resource_summary = resource_summary.reset_index()
     
     # Write summary headers
     summary_headers = ["Resource", "Driver", "Location", "Tasks", "Task 1", "Data", "Task Count", "Total Duration (months)", "Months"]
-    for col, header in enumerate(summary_headers, 1):
-        cell = ws_summary.cell(row=1, column=col)
-        cell.value = header
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal='center')
-        cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+    ws_summary.write_row(0, 0, summary_headers, header_fmt)
+    set_column_widths(ws_summary, [column_width(resource_summary[col], header)
+                                   for col, header in zip(resource_summary.columns, summary_headers)])
     
     # Write summary data
-    for i, (_, row) in enumerate(resource_summary.iterrows(), 2):
-        ws_summary.cell(row=i, column=1).value = row['Resource']
-        ws_summary.cell(row=i, column=2).value = row['Driver']
-        ws_summary.cell(row=i, column=3).value = row['Location']
-        ws_summary.cell(row=i, column=4).value = row['Tasks']
-        ws_summary.cell(row=i, column=5).value = row['Task1']
-        ws_summary.cell(row=i, column=6).value = row['Data']
-        ws_summary.cell(row=i, column=7).value = row['Task_Count']
-        ws_summary.cell(row=i, column=8).value = row['Total_Duration']
-        ws_summary.cell(row=i, column=9).value = row['Months']
+    summary_write_row = ws_summary.write_row
+    for i, row in enumerate(resource_summary.itertuples(index=False), 1):
+        values = [row.Resource, row.Driver, row.Location, row.Tasks, row.Task1, row.Data,
+                  row.Task_Count, row.Total_Duration, row.Months]
         
         # Add background color to distinguish rows
-        for col in range(1, 10):
-            cell = ws_summary.cell(row=i, column=col)
-            if i % 2 == 0:
-                cell.fill = PatternFill(start_color="F5F5F5", end_color="F5F5F5", fill_type="solid")
+        summary_write_row(i, 0, values, zebra_fmt if i % 2 == 1 else None)
     
     # Add a task legend sheet for Task 1 values
-    ws_legend = wb.create_sheet(title="Task 1 Legend")
+    ws_legend = wb.add_worksheet("Task 1 Legend")
     
     # Write legend headers
     legend_headers = ["Task 1", "Color"]
-    for col, header in enumerate(legend_headers, 1):
-        cell = ws_legend.cell(row=1, column=col)
-        cell.value = header
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal='center')
-        cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+    ws_legend.write_row(0, 0, legend_headers, header_fmt)
     
     # Calculate percentage of unique resource months for each Task 1
-    task1_percentages = calculate_task1_percentages(df_tasks, display_color_map)
+    task1_percentages = calculate_task1_percentages(df_tasks, sorted_displays, resource_months)
     
     # Write Display_Name (Task 1) colors with percentage
-    for i, display_name in enumerate(sorted(display_color_map.keys()), 2):
+    legend_write = ws_legend.write
+    legend_write_blank = ws_legend.write_blank
+    for i, display_name in enumerate(sorted_displays, 1):
         # Get percentage from calculated values
         percentage = task1_percentages.get(display_name, 0)
         
         # Format as "Task 1 Name (XX%)"
         display_text = f"{display_name} ({percentage:.0f}%)"
         
-        ws_legend.cell(row=i, column=1).value = display_text
+        legend_write(i, 0, display_text)
         
         # Color cell based on Display_Name
-        color_cell = ws_legend.cell(row=i, column=2)
-        color_cell.fill = PatternFill(start_color=display_color_map[display_name], 
-                                     end_color=display_color_map[display_name], 
-                                     fill_type="solid")
-    
-    # Auto-adjust column widths
-    for ws_name in [ws, ws_summary]:
-        for col in range(1, ws_name.max_column + 1):
-            max_length = 0
-            for row in range(1, ws_name.max_row + 1):
-                cell = ws_name.cell(row=row, column=col)
-                if cell.value:
-                    max_length = max(max_length, len(str(cell.value)))
-            adjusted_width = max(max_length + 2, 10)
-            ws_name.column_dimensions[get_column_letter(col)].width = adjusted_width
+        legend_write_blank(i, 1, None, fmt_map[display_name])
     
     # Save the workbook
-    wb.save(output_file)
+    wb.close()
     print(f"Excel Gantt chart saved to {output_file}")
 
 def main():
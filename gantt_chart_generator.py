@@ -8,18 +8,26 @@ Data, Location, and months from Jan to Dec.
 """
 
 import pandas as pd
+import numpy as np
 import plotly.figure_factory as ff
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs_version
 import argparse
-from datetime import datetime, timedelta
+from datetime import datetime
 import os
 
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Columns the chart is built from, with short month names; only these are parsed
+INPUT_COLUMNS = {'Task', 'Resource', 'Location', 'Business Driver', 'Group', *MONTHS}
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='Generate a Gantt chart from Excel data.')
     parser.add_argument('--input', '-i', required=True, help='Path to the input Excel file')
     parser.add_argument('--output', '-o', default='gantt_chart.html', help='Path to save the output Gantt chart HTML file')
+    parser.add_argument('--split', action='store_true', help='Also save the resource summary as a separate HTML file')
     return parser.parse_args()
 
 def read_excel_data(file_path):
@@ -28,7 +36,10 @@ def read_excel_data(file_path):
         raise FileNotFoundError(f"Input file not found: {file_path}")
     
     try:
-        df = pd.read_excel(file_path)
+        # Only load the used columns, and keep month cells as read so their
+        # values are not coerced before the truthiness check
+        df = pd.read_excel(file_path, usecols=lambda col: col in INPUT_COLUMNS,
+                           dtype={month: object for month in MONTHS})
         required_columns = ['Task', 'Resource', 'Location', 'Business Driver']
         
         # Check if the required columns exist
@@ -37,7 +48,7 @@ def read_excel_data(file_path):
             raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
         
         # Check for month columns
-        month_columns = [col for col in df.columns if col in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']]
+        month_columns = [col for col in df.columns if col in MONTHS]
         if not month_columns:
             raise ValueError("No month columns found (Jan-Dec)")
         
@@ -49,215 +60,219 @@ def process_data_for_gantt(df):
     """Process the Excel data into a format suitable for Gantt chart."""
     current_year = datetime.now().year
     
-    # Create a list to store task data
-    tasks = []
+    # Build an (N, 12) boolean matrix of active months; missing month columns
+    # are reindexed in as empty so column i is always month i + 1
+    month_cells = df.reindex(columns=list(MONTHS))
+    mask = month_cells.to_numpy(dtype=object, na_value=None).astype(bool)
     
-    # Month to number mapping
-    month_to_num = {
-        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-        'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-    }
+    # Find start and end months and the number of active months per row; the
+    # values fit in int8/int16, which keeps the task frame small
+    duration = mask.sum(axis=1, dtype=np.int16)
+    start_month = (mask.argmax(axis=1) + 1).astype(np.int8)
+    end_month = (12 - mask[:, ::-1].argmax(axis=1)).astype(np.int8)
     
-    # Process each row
-    for _, row in df.iterrows():
-        task_name = row['Task']
-        resource = row['Resource']
-        location = row['Location']
-        driver = row.get('Business Driver', '')  # Use get to handle missing column
-        group = row.get('Group', resource)  # Default to resource if Group is missing
-        
-        # Find start and end months
-        start_month = None
-        end_month = None
-        duration = 0
-        
-        for month in month_to_num.keys():
-            if month in df.columns and pd.notna(row[month]) and row[month]:
-                if start_month is None:
-                    start_month = month_to_num[month]
-                end_month = month_to_num[month]
-                duration += 1
-        
-        # Skip if no duration
-        if start_month is None or end_month is None:
-            continue
-        
-        # Create start and end dates
-        start_date = datetime(current_year, start_month, 1)
-        # End date is the last day of the end month
-        if end_month == 12:
-            end_date = datetime(current_year, 12, 31)
-        else:
-            end_date = datetime(current_year, end_month + 1, 1) - timedelta(days=1)
-        
-        # Create a combined key for Resource, Driver, Location
-        resource_key = f"{resource} | {driver} | {location}"
-        
-        # Add task to the list
-        tasks.append({
-            'Task': task_name,
-            'Resource': resource,
-            'Location': location,
-            'Driver': driver,
-            'ResourceKey': resource_key,  # Combined key for grouping
-            'Group': group,
-            'Start': start_date,
-            'Finish': end_date,
-            'Duration': duration,
-            'StartMonth': start_month,
-            'EndMonth': end_month
-        })
+    # Skip rows without any active month
+    keep = duration > 0
+    rows = df[keep]
+    duration = duration[keep]
+    start_month = start_month[keep]
+    end_month = end_month[keep]
+    
+    task_name = rows['Task']
+    resource = rows['Resource']
+    location = rows['Location']
+    driver = rows.get('Business Driver', pd.Series('', index=rows.index))  # Use get to handle missing column
+    group = rows.get('Group', resource)  # Default to resource if Group is missing
     
-    return pd.DataFrame(tasks)
+    # Create start and end dates by looking them up in the 12 month starts and
+    # ends of the year; the end date is the last day of the end month
+    month_starts = pd.date_range(start=f"{current_year}-01-01", periods=12, freq='MS')
+    month_ends = month_starts + pd.offsets.MonthEnd(0)
+    start_date = month_starts[start_month - 1]
+    end_date = month_ends[end_month - 1]
+    
+    return pd.DataFrame({
+        'Task': task_name.to_numpy(),
+        'Resource': resource.to_numpy(),
+        'Location': location.to_numpy(),
+        'Driver': driver.to_numpy(),
+        'Group': group.to_numpy(),
+        'Start': start_date.to_numpy(),
+        'Finish': end_date.to_numpy(),
+        'Duration': duration,
+        'StartMonth': start_month,
+        'EndMonth': end_month
+    })
 
-def create_gantt_chart(df_tasks, output_file):
+def create_gantt_chart(df_tasks, output_file, split=False):
     """Create and save the Gantt chart."""
     if df_tasks.empty:
         raise ValueError("No valid task data found for creating Gantt chart")
     
-    # Sort by Resource, Driver, Location
+    # Sort by Resource, Driver, Location. The key columns are made categorical
+    # first so the sort and the groupbys below compare integer codes
+    group_columns = ['Resource', 'Driver', 'Location']
+    df_tasks = df_tasks.astype({col: 'category' for col in group_columns})
     df_tasks = df_tasks.sort_values(by=['Resource', 'Driver', 'Location', 'Start'])
     
-    # Create a color map for tasks
-    tasks = df_tasks['Task'].unique()
-    colors = px.colors.qualitative.Plotly[:len(tasks)]
-    task_color_map = dict(zip(tasks, colors))
+    # Number the tasks in order of first appearance; the codes pick each
+    # task's color and bars without a dict lookup per bar
+    task_codes, tasks = pd.factorize(df_tasks['Task'], use_na_sentinel=False)
+    tasks = tasks.tolist()
+    # Cycle through the palette when there are more tasks than colors
+    palette = px.colors.qualitative.Plotly
+    task_colors = [palette[i % len(palette)] for i in range(len(tasks))]
     
-    # Group by ResourceKey (Resource | Driver | Location)
-    resource_keys = df_tasks['ResourceKey'].unique()
+    # Group by Resource, Driver and Location; the frame is already sorted, so
+    # ngroup numbers the groups in the order they are drawn
+    df_tasks['GroupIdx'] = df_tasks.groupby(group_columns, sort=False, dropna=False, observed=True).ngroup()
+    resource_keys = df_tasks[group_columns].drop_duplicates()
     
-    # Create a figure with subplots - one timeline per month
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    # Build the hover text of all tasks at once; missing values read 'nan'
+    # like the per-task f-string did
+    labels = {col: df_tasks[col].astype(str).fillna('nan') for col in ['Task', 'Resource', 'Driver', 'Location']}
+    hovertexts = ("<b>Task:</b> " + labels['Task']
+                  + "<br><b>Resource:</b> " + labels['Resource']
+                  + "<br><b>Driver:</b> " + labels['Driver']
+                  + "<br><b>Location:</b> " + labels['Location']
+                  + "<br><b>Duration:</b> " + df_tasks['Duration'].astype(str) + " month(s)"
+                  + "<br><b>Start:</b> " + df_tasks['Start'].dt.strftime('%b %Y')
+                  + "<br><b>End:</b> " + df_tasks['Finish'].dt.strftime('%b %Y'))
     
-    # Create the main figure
-    fig = go.Figure()
+    # One horizontal bar per task row, from the start of its first month to the
+    # end of its last; month i is centered on position i - 1. A stable sort by
+    # task code lays the bars of each task out contiguously
+    bar_order = np.argsort(task_codes, kind='stable')
+    bar_bounds = np.searchsorted(task_codes[bar_order], np.arange(len(tasks) + 1))
+    bar_lengths = (df_tasks['EndMonth'] - df_tasks['StartMonth'] + 1).to_numpy()[bar_order]
+    bar_bases = (df_tasks['StartMonth'] - 1.5).to_numpy()[bar_order]
+    bar_rows = df_tasks['GroupIdx'].to_numpy()[bar_order]
+    bar_hovertexts = hovertexts.to_numpy(dtype=object)[bar_order]
     
-    # Add a separate trace for each task
-    for idx, (resource_key, group) in enumerate(df_tasks.groupby('ResourceKey')):
-        # Split the resource key back into components
-        resource, driver, location = resource_key.split(' | ')
-        
-        # For each task in this resource group
-        for _, task in group.iterrows():
-            # Create a list of month positions where this task is active
-            month_positions = []
-            for i, month in enumerate(months):
-                month_num = i + 1  # 1-based month number
-                if month_num >= task['StartMonth'] and month_num <= task['EndMonth']:
-                    month_positions.append(i)
-            
-            # Add a bar for this task spanning the correct months
-            if month_positions:
-                fig.add_trace(go.Bar(
-                    x=month_positions,  # X positions are month indices
-                    y=[idx],  # Y position is the resource group index
-                    width=0.8,  # Width of the bar
-                    marker=dict(color=task_color_map[task['Task']]),
-                    name=task['Task'],  # Use task name for the legend
-                    text=task['Task'],  # Show task name on the bar
-                    textposition='inside',
-                    insidetextanchor='middle',
-                    textfont=dict(color='white', size=12),
-                    hoverinfo='text',
-                    hovertext=f"<b>Task:</b> {task['Task']}<br>"
-                              f"<b>Resource:</b> {resource}<br>"
-                              f"<b>Driver:</b> {driver}<br>"
-                              f"<b>Location:</b> {location}<br>"
-                              f"<b>Duration:</b> {task['Duration']} month(s)<br>"
-                              f"<b>Start:</b> {task['Start'].strftime('%b %Y')}<br>"
-                              f"<b>End:</b> {task['Finish'].strftime('%b %Y')}"
-                ))
+    # One bar trace per task spanning all of its months. Traces are plain
+    # dicts, so plotly does not validate and copy a graph object for each one
+    traces = [
+        {
+            'type': 'bar',
+            'orientation': 'h',
+            'x': bar_lengths[first:last].tolist(),  # Bar length is the number of months spanned
+            'base': bar_bases[first:last].tolist(),  # Bars start at their first month
+            'y': bar_rows[first:last].tolist(),  # Y position is the resource group index
+            'width': 0.8,  # Width of the bar
+            'marker': {'color': task_colors[code]},
+            'name': task_name,  # Use task name for the legend
+            'text': task_name,  # Show task name on the bar
+            'textposition': 'inside',
+            'insidetextanchor': 'middle',
+            'textfont': {'color': 'white', 'size': 12},
+            'hoverinfo': 'text',
+            'hovertext': bar_hovertexts[first:last].tolist()
+        }
+        for code, (task_name, first, last) in enumerate(zip(tasks, bar_bounds[:-1], bar_bounds[1:]))
+    ]
     
     # Add resource labels on the y-axis
-    y_labels = []
-    y_positions = []
-    
-    for idx, resource_key in enumerate(resource_keys):
-        resource, driver, location = resource_key.split(' | ')
-        y_labels.append(f"{resource} | {driver} | {location}")
-        y_positions.append(idx)
+    y_labels = [f"{resource} | {driver} | {location}"
+                for resource, driver, location in resource_keys.itertuples(index=False)]
+    y_positions = list(range(len(y_labels)))
     
     # Customize the layout
-    fig.update_layout(
-        title={
+    layout = {
+        'title': {
             'text': "<b>Project Gantt Chart</b>",
             'font': {'size': 24}
         },
-        xaxis=dict(
-            title="<b>Months</b>",
-            tickmode='array',
-            tickvals=list(range(len(months))),
-            ticktext=months,
-            showgrid=True,
-        ),
-        yaxis=dict(
-            title="<b>Resource | Driver | Location</b>",
-            tickmode='array',
-            tickvals=y_positions,
-            ticktext=y_labels,
-            showgrid=True,
-        ),
-        barmode='overlay',
-        height=max(600, len(resource_keys) * 50),  # Adjust height based on number of resource groups
-        margin=dict(l=300, r=50, t=100, b=100),  # Increased left margin for resource labels
-        legend_title="<b>Tasks</b>",
-        hovermode="closest",
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        )
-    )
+        'xaxis': {
+            'title': {'text': "<b>Months</b>"},
+            'tickmode': 'array',
+            'tickvals': list(range(len(MONTHS))),
+            'ticktext': list(MONTHS),
+            'showgrid': True,
+        },
+        'yaxis': {
+            'title': {'text': "<b>Resource | Driver | Location</b>"},
+            'tickmode': 'array',
+            'tickvals': y_positions,
+            'ticktext': y_labels,
+            'showgrid': True,
+        },
+        'barmode': 'overlay',
+        'height': max(600, len(resource_keys) * 50),  # Adjust height based on number of resource groups
+        'margin': {'l': 300, 'r': 50, 't': 100, 'b': 100},  # Increased left margin for resource labels
+        'hovermode': "closest",
+        'legend': {
+            'title': {'text': "<b>Tasks</b>"},
+            'orientation': "h",
+            'yanchor': "bottom",
+            'y': 1.02,
+            'xanchor': "right",
+            'x': 1
+        }
+    }
     
-    # Create a second figure for resource details
-    resource_details_file = output_file.replace('.html', '_resources.html')
+    # Create the main figure from the prebuilt dicts without re-validating them
+    fig = go.Figure(data=traces, layout=layout, _validate=False)
     
+    # Create a second figure for resource details
     # Create a summary table by resource, driver, location
-    resource_summary = df_tasks.groupby(['Resource', 'Driver', 'Location']).agg(
+    resource_summary = df_tasks.groupby(group_columns, observed=True).agg(
         Tasks=('Task', lambda x: ', '.join(sorted(set(x)))),
         Task_Count=('Task', 'count'),
-        Total_Duration=('Duration', 'sum'),
-        Months=('Task', lambda x: ', '.join([f"{months[m-1]}" for m in sorted(set(
-            [month for task_idx, task in df_tasks[df_tasks['Task'].isin(x)].iterrows() 
-             for month in range(task['StartMonth'], task['EndMonth']+1)]))]))
-    ).reset_index()
+        Total_Duration=('Duration', 'sum')
+    )
     
-    fig_resources = go.Figure(data=[go.Table(
-        header=dict(
-            values=["<b>Resource</b>", "<b>Driver</b>", "<b>Location</b>", "<b>Tasks</b>", "<b>Task Count</b>", "<b>Total Duration</b>", "<b>Months</b>"],
-            fill_color='royalblue',
-            align='left',
-            font=dict(color='white', size=14)
-        ),
-        cells=dict(
-            values=[
-                resource_summary['Resource'],
-                resource_summary['Driver'],
-                resource_summary['Location'],
-                resource_summary['Tasks'],
-                resource_summary['Task_Count'],
-                resource_summary['Total_Duration'],
-                resource_summary['Months']
-            ],
-            fill_color='lavender',
-            align='left',
-            font=dict(size=12)
-        )
-    )])
+    # Months covered by each group: an (N, 12) task month matrix, OR-reduced
+    # per group in one groupby instead of rescanning the tasks of every group
+    month_nums = np.arange(1, 13)
+    month_mask = ((month_nums >= df_tasks['StartMonth'].to_numpy()[:, None])
+                  & (month_nums <= df_tasks['EndMonth'].to_numpy()[:, None]))
+    group_mask = pd.DataFrame(month_mask, index=pd.MultiIndex.from_frame(df_tasks[group_columns]))
+    group_mask = group_mask.groupby(level=[0, 1, 2], observed=True).any()
+    month_names = np.array(MONTHS)
+    resource_summary['Months'] = pd.Series(
+        [', '.join(month_names[covered]) for covered in group_mask.to_numpy()],
+        index=group_mask.index, dtype=object)
+    resource_summary = resource_summary.reset_index()
     
-    fig_resources.update_layout(
-        title="<b>Resource Summary</b>",
-        height=max(400, len(resource_summary) * 50)
-    )
+    fig_resources = go.Figure(data=[{
+        'type': 'table',
+        'header': {
+            'values': ["<b>Resource</b>", "<b>Driver</b>", "<b>Location</b>", "<b>Tasks</b>", "<b>Task Count</b>", "<b>Total Duration</b>", "<b>Months</b>"],
+            'fill': {'color': 'royalblue'},
+            'align': 'left',
+            'font': {'color': 'white', 'size': 14}
+        },
+        'cells': {
+            'values': [
+                resource_summary['Resource'].tolist(),
+                resource_summary['Driver'].tolist(),
+                resource_summary['Location'].tolist(),
+                resource_summary['Tasks'].tolist(),
+                resource_summary['Task_Count'].tolist(),
+                resource_summary['Total_Duration'].tolist(),
+                resource_summary['Months'].tolist()
+            ],
+            'fill': {'color': 'lavender'},
+            'align': 'left',
+            'font': {'size': 12}
+        }
+    }], layout={
+        'title': {'text': "<b>Resource Summary</b>"},
+        'height': max(400, len(resource_summary) * 50)
+    }, _validate=False)
     
-    # Save the resource details to an HTML file
-    fig_resources.write_html(resource_details_file)
-    print(f"Resource summary saved to {resource_details_file}")
+    # Save the resource details to a separate HTML file only when requested;
+    # the combined file below always includes them
+    if split:
+        resource_details_file = os.path.splitext(output_file)[0] + '_resources.html'
+        fig_resources.write_html(resource_details_file)
+        print(f"Resource summary saved to {resource_details_file}")
     
-    # Combine both visualizations into a single HTML file with tabs
-    with open(output_file, 'w') as f:
+    # Combine both visualizations into a single HTML file with tabs. Each
+    # figure is serialized to JSON once and plotted by one shared plotly.js;
+    # the page is written piece by piece so the figure JSON is never copied
+    # into one large string
+    with open(output_file, 'w', buffering=1 << 20) as f:
         f.write(f'''
         <!DOCTYPE html>
         <html>
@@ -272,7 +287,7 @@ def create_gantt_chart(df_tasks, output_file):
                 .tabcontent {{display: none; padding: 6px 12px; border: 1px solid #ccc; border-top: none;}}
                 #GanttChart {{display: block;}}
             </style>
-            <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+            <script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>
         </head>
         <body>
             <div class="tab">
@@ -281,27 +296,36 @@ def create_gantt_chart(df_tasks, output_file):
             </div>
             
             <div id="GanttChart" class="tabcontent">
-                {fig.to_html(full_html=False, include_plotlyjs=False)}
+                <div id="GanttChartPlot"></div>
             </div>
             
             <div id="ResourceSummary" class="tabcontent">
-                {fig_resources.to_html(full_html=False, include_plotlyjs=False)}
+                <div id="ResourceSummaryPlot"></div>
             </div>
             
             <script>
-            function openTab(evt, tabName) {{
+            var ganttFigure = ''')
+        f.write(fig.to_json())
+        f.write(''';
+            var resourceFigure = ''')
+        f.write(fig_resources.to_json())
+        f.write(''';
+            Plotly.newPlot('GanttChartPlot', ganttFigure.data, ganttFigure.layout, {responsive: true});
+            Plotly.newPlot('ResourceSummaryPlot', resourceFigure.data, resourceFigure.layout, {responsive: true});
+            
+            function openTab(evt, tabName) {
                 var i, tabcontent, tablinks;
                 tabcontent = document.getElementsByClassName("tabcontent");
-                for (i = 0; i < tabcontent.length; i++) {{
+                for (i = 0; i < tabcontent.length; i++) {
                     tabcontent[i].style.display = "none";
-                }}
+                }
                 tablinks = document.getElementsByClassName("tablinks");
-                for (i = 0; i < tablinks.length; i++) {{
+                for (i = 0; i < tablinks.length; i++) {
                     tablinks[i].className = tablinks[i].className.replace(" active", "");
-                }}
+                }
                 document.getElementById(tabName).style.display = "block";
                 evt.currentTarget.className += " active";
-            }}
+            }
             </script>
         </body>
         </html>
@@ -324,7 +348,7 @@ def main():
         
         # Create and save Gantt chart
         print(f"Creating Gantt chart and saving to {args.output}...")
-        fig = create_gantt_chart(df_tasks, args.output)
+        fig = create_gantt_chart(df_tasks, args.output, split=args.split)
         
         print("Done!")
     except Exception as e:
@@ -12,12 +12,24 @@ Usage:
 """
 
 import pandas as pd
+import numpy as np
 import argparse
 import os
-from datetime import datetime, timedelta
-from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Alignment, Font
-from openpyxl.utils import get_column_letter
+from datetime import datetime
+import xlsxwriter
+
+# Full month names in calendar order and their month numbers
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+MONTH_TO_NUM = {month: num for num, month in enumerate(MONTH_NAMES, 1)}
+
+# Columns passed to read_excel's usecols, so the rest of the sheet is never parsed
+INPUT_COLUMNS = {'Task', 'Task 1', 'Business Driver', 'Resources', 'Data', 'Location', *MONTH_NAMES}
+
+# Formats for header rows, Gantt group labels and striped summary rows
+HEADER_FORMAT = {'bold': True, 'align': 'center', 'bg_color': '#DDDDDD', 'pattern': 1}
+GROUP_FORMAT = {'bold': True, 'bg_color': '#EEEEEE', 'pattern': 1}
+STRIPE_FORMAT = {'bg_color': '#F5F5F5', 'pattern': 1}
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -32,7 +44,10 @@ def read_excel_data(file_path):
         raise FileNotFoundError(f"Input file not found: {file_path}")
     
     try:
-        df = pd.read_excel(file_path)
+        # Only parse the columns we use; month cells are kept as raw objects so
+        # that any non-empty marker counts, without a dtype inference pass
+        df = pd.read_excel(file_path, usecols=lambda col: col in INPUT_COLUMNS,
+                           dtype={month: object for month in MONTH_NAMES})
         
         # Check if the required columns exist
         missing_columns = []
@@ -44,10 +59,7 @@ def read_excel_data(file_path):
             raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
         
         # Check for month columns - using full month names
-        full_month_names = ['January', 'February', 'March', 'April', 'May', 'June', 
-                           'July', 'August', 'September', 'October', 'November', 'December']
-        
-        month_columns = [col for col in df.columns if col in full_month_names]
+        month_columns = [col for col in df.columns if col in MONTH_TO_NUM]
         if not month_columns:
             raise ValueError("No month columns found (January-December)")
         
@@ -59,79 +71,82 @@ def process_data_for_gantt(df):
     """Process the Excel data into a format suitable for Gantt chart."""
     current_year = datetime.now().year
     
-    # Create a list to store task data
-    tasks = []
-    
-    # Month to number mapping using full month names
-    month_to_num = {
-        'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
-        'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12
-    }
-    
-    # Process each row
-    for _, row in df.iterrows():
-        task_name = row['Task']
-        resource = row['Resources']  # Note: using 'Resources' instead of 'Resource'
-        location = row['Location']
-        driver = row.get('Business Driver', '')  # Use get to handle missing column
-        task1 = row.get('Task 1', '')  # Get Task 1 value
-        data = row.get('Data', '')  # Get Data value
-        
-        # Find start and end months
-        start_month = None
-        end_month = None
-        duration = 0
-        
-        for month in month_to_num.keys():
-            if month in df.columns and pd.notna(row[month]) and row[month]:
-                if start_month is None:
-                    start_month = month_to_num[month]
-                end_month = month_to_num[month]
-                duration += 1
-        
-        # Skip if no duration
-        if start_month is None or end_month is None:
-            continue
-        
-        # Create start and end dates
-        start_date = datetime(current_year, start_month, 1)
-        # End date is the last day of the end month
-        if end_month == 12:
-            end_date = datetime(current_year, 12, 31)
-        else:
-            end_date = datetime(current_year, end_month + 1, 1) - timedelta(days=1)
-        
-        # Use Task 1 as the primary identifier, fallback to Task if Task 1 is empty
-        display_name = task1 if pd.notna(task1) and task1 else task_name
-        
-        # Create a combined key for Resource, Driver, Location
-        resource_key = f"{resource} | {driver} | {location}"
-        
-        # Add task to the list
-        tasks.append({
-            'Task': task_name,
-            'Task 1': task1,
-            'Display_Name': display_name,  # New field for display purposes
-            'Resource': resource,
-            'Location': location,
-            'Driver': driver,
-            'Data': data,
-            'ResourceKey': resource_key,  # Combined key for grouping
-            'Start': start_date,
-            'Finish': end_date,
-            'Duration': duration,
-            'Start_Month': start_month,
-            'End_Month': end_month
-        })
-    
-    return pd.DataFrame(tasks)
+    # Build an (N, months) boolean matrix: a month is active when its cell is set
+    present_columns = set(df.columns)
+    month_columns = [month for month in MONTH_NAMES if month in present_columns]
+    month_nums = np.array([MONTH_TO_NUM[month] for month in month_columns], dtype=np.int8)
+    mask = df[month_columns].to_numpy(dtype=object, na_value=None).astype(bool)
+    
+    # Find start and end months and the number of active months per row; all
+    # three fit in int8, which keeps the output columns compact
+    duration = mask.sum(axis=1, dtype=np.int8)
+    start_idx = mask.argmax(axis=1)
+    end_idx = mask.shape[1] - 1 - mask[:, ::-1].argmax(axis=1)
+    start_month = month_nums[start_idx]
+    end_month = month_nums[end_idx]
+    
+    # Skip rows without any active month
+    keep = duration > 0
+    rows = df[keep]
+    duration = duration[keep]
+    start_month = start_month[keep]
+    end_month = end_month[keep]
+    
+    task_name = rows['Task']
+    resource = rows['Resources']  # Note: using 'Resources' instead of 'Resource'
+    location = rows['Location']
+    empty = pd.Series('', index=rows.index)
+    driver = rows.get('Business Driver', empty)  # Use get to handle missing column
+    task1 = rows.get('Task 1', empty)  # Get Task 1 value
+    data = rows.get('Data', empty)  # Get Data value
+    
+    # Create start and end dates; the end date is the last day of the end month
+    months = pd.period_range(start=f"{current_year}-01", periods=12, freq='M')
+    start_date = months[start_month - 1].to_timestamp(how='start')
+    end_date = months[end_month - 1].to_timestamp(how='end').normalize()
+    
+    # Use Task 1 as the primary identifier, fallback to Task if Task 1 is empty
+    display_name = task1.where(task1.notna() & (task1 != ''), task_name)
+    
+    return pd.DataFrame({
+        'Task': task_name.to_numpy(),
+        'Task 1': task1.to_numpy(),
+        'Display_Name': display_name.to_numpy(),  # New field for display purposes
+        'Resource': resource.to_numpy(),
+        'Location': location.to_numpy(),
+        'Driver': driver.to_numpy(),
+        'Data': data.to_numpy(),
+        'Start': start_date.to_numpy(),
+        'Finish': end_date.to_numpy(),
+        'Duration': duration,
+        'Start_Month': start_month,
+        'End_Month': end_month
+    })
+
+def column_width(values, header):
+    """Size a column to fit its header and longest value, with a minimum width of 10."""
+    lengths = values.dropna().astype(str).str.len()
+    max_length = max(len(header), lengths.max() if len(lengths) else 0)
+    return max(max_length + 2, 10)
+
+def set_column_widths(ws, widths):
+    """Set each worksheet column to its width from the list."""
+    for col, width in enumerate(widths):
+        ws.set_column(col, col, width)
 
 def create_excel_gantt(df_tasks, output_file):
     """Create an Excel file with Gantt chart representation."""
-    # Create a new workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Gantt Chart"
+    # Without tasks there is nothing to chart; write a stub sheet saying so
+    if df_tasks.empty:
+        wb = xlsxwriter.Workbook(output_file)
+        wb.add_worksheet("Gantt Chart").write_string(0, 0, "No tasks found")
+        wb.close()
+        return
+    
+    # Create a new workbook; constant_memory flushes each row to disk once the
+    # next one starts, so rows must be written in increasing order
+    wb = xlsxwriter.Workbook(output_file, {'constant_memory': True, 'strings_to_numbers': False})
+    ws = wb.add_worksheet("Gantt Chart")
     
     # Sort tasks by Resource, Driver, Location, and Start date
     df_tasks = df_tasks.sort_values(by=['Resource', 'Driver', 'Location', 'Start'])
@@ -149,146 +164,138 @@ def create_excel_gantt(df_tasks, output_file):
     for i, name in enumerate(sorted(display_names)):
         display_color_map[name] = colors[i % len(colors)]
     
+    # Create the formats once; bars get one plain and one labelled format per color
+    header_fmt = wb.add_format(HEADER_FORMAT)
+    group_fmt = wb.add_format(GROUP_FORMAT)
+    stripe_fmt = wb.add_format(STRIPE_FORMAT)
+    bar_fmts = {color: wb.add_format({'bg_color': f"#{color}", 'pattern': 1})
+                for color in set(display_color_map.values())}
+    label_fmts = {color: wb.add_format({'bg_color': f"#{color}", 'pattern': 1, 'bold': True,
+                                        'font_color': '#FFFFFF', 'align': 'left'})
+                  for color in set(display_color_map.values())}
+    
     # Month headers - using full month names
-    month_headers = ["January", "February", "March", "April", "May", "June", 
-                     "July", "August", "September", "October", "November", "December"]
+    month_headers = MONTH_NAMES
     
     # Set up headers
     headers = ["Resource", "Driver", "Location"]
     
+    # Bar label: Display_Name (Task 1) with the percentage of the year (duration / 12 months)
+    df_tasks['Bar_Label'] = (df_tasks['Display_Name'].astype(str) + ' ('
+                             + (df_tasks['Duration'] / 12 * 100).round().astype(int).astype(str) + '%)')
+    
+    # Compute column widths from the data; a month column holds the labels of
+    # the bars starting in that month
+    label_lengths = df_tasks['Bar_Label'].str.len().groupby(df_tasks['Start_Month']).max()
+    gantt_widths = [column_width(df_tasks[col], header)
+                    for col, header in zip(['Resource', 'Driver', 'Location'], headers)]
+    gantt_widths += [max(len(month) + 2, label_lengths.get(month_num, 0) + 2, 10)
+                     for month_num, month in enumerate(month_headers, 1)]
+    set_column_widths(ws, gantt_widths)
+    
     # Write headers
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col)
-        cell.value = header
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal='center')
-        cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-    
-    # Write month headers
-    for col, month in enumerate(month_headers, len(headers) + 1):
-        cell = ws.cell(row=1, column=col)
-        cell.value = month
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal='center')
-        cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-    
-    # Group by ResourceKey (Resource | Driver | Location)
-    row_idx = 2
-    current_resource_key = None
-    
-    # Process each resource group
-    for resource_key, group in df_tasks.groupby('ResourceKey'):
-        resource, driver, location = resource_key.split(' | ')
-        
-        # No blank rows between resource groups
+    ws.write_row(0, 0, headers + month_headers, header_fmt)
+    
+    # Process each resource group; df_tasks is already sorted by the group columns
+    bar_columns = ['Display_Name', 'Start_Month', 'End_Month', 'Bar_Label']
+    row_idx = 1
+    for group_key, group in df_tasks.groupby(['Resource', 'Driver', 'Location'], sort=False, dropna=False):
+        resource, driver, location = ['' if pd.isna(value) else str(value) for value in group_key]
         
-        # Write the resource, driver, location in the first columns
-        ws.cell(row=row_idx, column=1).value = resource
-        ws.cell(row=row_idx, column=2).value = driver
-        ws.cell(row=row_idx, column=3).value = location
+        # Write the resource, driver, location in the first columns. Cell types
+        # are known here, so the typed write_* calls skip the dispatch in write()
+        for col, value in enumerate((resource, driver, location)):
+            ws.write_string(row_idx, col, value, group_fmt)
         
-        # Add background color to the resource info cells
-        for col in range(1, 4):
-            cell = ws.cell(row=row_idx, column=col)
-            cell.fill = PatternFill(start_color="EEEEEE", end_color="EEEEEE", fill_type="solid")
-            cell.font = Font(bold=True)
+        # Month slots are filled in by the tasks of this resource group
+        month_values = [None] * len(month_headers)
+        month_fmts = [None] * len(month_headers)
         
         # For each task in this resource group, add bars in the month columns
-        for _, task in group.iterrows():
-            # For each month in the task's duration
-            for month_idx in range(task['Start_Month'], task['End_Month'] + 1):
-                col_idx = month_idx + len(headers)  # Adjust column index for month
-                
-                # Add the task to the cell
-                cell = ws.cell(row=row_idx, column=col_idx)
-                
-                # Color based on Display_Name (Task 1 value)
-                cell.fill = PatternFill(start_color=display_color_map[task['Display_Name']], 
-                                       end_color=display_color_map[task['Display_Name']], 
-                                       fill_type="solid")
-                
-                # Add Display_Name (Task 1) with percentage to the first cell of the bar
-                if month_idx == task['Start_Month']:
-                    # Calculate percentage of year (duration / 12 months)
-                    duration = task['Duration']
-                    percentage = (duration / 12) * 100
-                    
-                    # Format as "Task 1 Name (XX%)"
-                    display_text = f"{task['Display_Name']} ({percentage:.0f}%)"
-                    
-                    cell.value = display_text
-                    cell.alignment = Alignment(horizontal='left')
-                    cell.font = Font(color="FFFFFF", bold=True)
+        for task in group[bar_columns].itertuples(index=False):
+            # Color based on Display_Name (Task 1 value)
+            color = display_color_map[task.Display_Name]
+            for month_idx in range(task.Start_Month, task.End_Month + 1):
+                if month_idx == task.Start_Month:
+                    # Add Display_Name (Task 1) with percentage to the first cell of the bar
+                    month_values[month_idx - 1] = task.Bar_Label
+                    month_fmts[month_idx - 1] = label_fmts[color]
+                elif month_values[month_idx - 1] is None:
+                    month_fmts[month_idx - 1] = bar_fmts[color]
+                else:
+                    # Keep the label of an earlier bar but repaint it in this color
+                    month_fmts[month_idx - 1] = label_fmts[color]
+        
+        for month_idx, (value, fmt) in enumerate(zip(month_values, month_fmts)):
+            if fmt is None:
+                continue
+            if value is None:
+                ws.write_blank(row_idx, len(headers) + month_idx, None, fmt)
+            else:
+                ws.write_string(row_idx, len(headers) + month_idx, value, fmt)
         
         row_idx += 1
     
     # Add a summary sheet
-    ws_summary = wb.create_sheet(title="Resource Summary")
+    ws_summary = wb.add_worksheet("Resource Summary")
+    
+    # Encode the months of each task as a 12-bit mask (bit 0 is January) so the
+    # months covered by a resource group are a single bitwise OR of its tasks
+    start_bits = df_tasks['Start_Month'].astype(np.int16) - 1
+    end_bits = df_tasks['End_Month'].astype(np.int16)
+    df_tasks['Month_Mask'] = np.left_shift(1, end_bits) - np.left_shift(1, start_bits)
     
     # Create a summary table by resource, driver, location
-    # Make sure to handle empty values properly
-    resource_summary = df_tasks.groupby(['Resource', 'Driver', 'Location']).agg(
-        Tasks=('Task', lambda x: ', '.join(sorted(set(x)))),
-        Task1=('Task 1', lambda x: ', '.join(sorted(set([str(i) for i in x if pd.notna(i) and i != ''])))),
-        Data=('Data', lambda x: ', '.join(sorted(set([str(i) for i in x if pd.notna(i) and i != ''])))),
+    group_columns = ['Resource', 'Driver', 'Location']
+    resource_summary = df_tasks.groupby(group_columns).agg(
         Task_Count=('Task', 'count'),
         Total_Duration=('Duration', 'sum'),
-        Months=('Task', lambda x: ', '.join([month_headers[m-1] for m in sorted(set(
-            [month for task_idx, task in df_tasks[df_tasks['Task'].isin(x)].iterrows() 
-             for month in range(task['Start_Month'], task['End_Month']+1)]))]))
-    ).reset_index()
+        Month_Mask=('Month_Mask', lambda x: np.bitwise_or.reduce(x.to_numpy()))
+    )
     
-    # Replace 'nan' strings with empty strings
-    for col in ['Task1', 'Data']:
-        resource_summary[col] = resource_summary[col].str.replace('nan', '').str.strip(', ')
-        # Also handle cases where the string starts or ends with a comma
-        resource_summary[col] = resource_summary[col].str.strip(', ')
+    # Join the sorted distinct values of the text columns per group. Missing
+    # values are turned into empty strings once up front and skipped in the join
+    text_values = df_tasks[['Task', 'Task 1', 'Data']].fillna('').astype(str)
+    grouped_text = text_values.groupby([df_tasks[col] for col in group_columns])
+    for col, text_col in [('Tasks', 'Task'), ('Task1', 'Task 1'), ('Data', 'Data')]:
+        resource_summary[col] = grouped_text[text_col].unique().map(
+            lambda values: ', '.join(sorted(value for value in values if value)))
+    resource_summary = resource_summary.reset_index()
+    
+    # Turn the combined month masks back into month names
+    resource_summary['Months'] = resource_summary['Month_Mask'].map(
+        lambda mask: ', '.join(month for i, month in enumerate(month_headers) if mask & (1 << i)))
     
     # Write summary headers
     summary_headers = ["Resource", "Driver", "Location", "Tasks", "Task 1", "Data", 
                        "Task Count", "Total Duration (months)", "Months"]
-    for col, header in enumerate(summary_headers, 1):
-        cell = ws_summary.cell(row=1, column=col)
-        cell.value = header
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal='center')
-        cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+    ws_summary.write_row(0, 0, summary_headers, header_fmt)
     
     # Write summary data
-    for i, (_, row) in enumerate(resource_summary.iterrows(), 2):
-        ws_summary.cell(row=i, column=1).value = row['Resource']
-        ws_summary.cell(row=i, column=2).value = row['Driver']
-        ws_summary.cell(row=i, column=3).value = row['Location']
-        ws_summary.cell(row=i, column=4).value = row['Tasks']
-        ws_summary.cell(row=i, column=5).value = row['Task1']
-        ws_summary.cell(row=i, column=6).value = row['Data']
-        ws_summary.cell(row=i, column=7).value = row['Task_Count']
-        ws_summary.cell(row=i, column=8).value = row['Total_Duration']
-        ws_summary.cell(row=i, column=9).value = row['Months']
-        
+    summary_columns = ['Resource', 'Driver', 'Location', 'Tasks', 'Task1', 'Data',
+                       'Task_Count', 'Total_Duration', 'Months']
+    set_column_widths(ws_summary, [column_width(resource_summary[col], header)
+                                   for col, header in zip(summary_columns, summary_headers)])
+    # Convert the summary to plain Python rows in one pass; each row is then a
+    # single write_row call that also applies the stripe format
+    summary_rows = resource_summary[summary_columns].to_numpy(dtype=object).tolist()
+    for i, row in enumerate(summary_rows, 1):
         # Add background color to distinguish rows
-        for col in range(1, 10):
-            cell = ws_summary.cell(row=i, column=col)
-            if i % 2 == 0:
-                cell.fill = PatternFill(start_color="F5F5F5", end_color="F5F5F5", fill_type="solid")
+        ws_summary.write_row(i, 0, row, stripe_fmt if i % 2 == 1 else None)
     
     # Add a task legend sheet for Task 1 values
-    ws_legend = wb.create_sheet(title="Task 1 Legend")
+    ws_legend = wb.add_worksheet("Task 1 Legend")
     
     # Write legend headers
     legend_headers = ["Task 1", "Color"]
-    for col, header in enumerate(legend_headers, 1):
-        cell = ws_legend.cell(row=1, column=col)
-        cell.value = header
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal='center')
-        cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+    ws_legend.write_row(0, 0, legend_headers, header_fmt)
+    legend_texts = []
     
     # Calculate percentage of year for each Task 1
     task1_durations = {}
-    for _, task in df_tasks.iterrows():
-        display_name = task['Display_Name']
-        duration = task['Duration']
+    for task in df_tasks[['Display_Name', 'Duration']].itertuples(index=False):
+        display_name = task.Display_Name
+        duration = task.Duration
         
         if display_name in task1_durations:
             task1_durations[display_name] = max(task1_durations[display_name], duration)
@@ -296,7 +303,7 @@ def create_excel_gantt(df_tasks, output_file):
             task1_durations[display_name] = duration
     
     # Write Display_Name (Task 1) colors with percentage
-    for i, display_name in enumerate(sorted(display_color_map.keys()), 2):
+    for i, display_name in enumerate(sorted(display_color_map.keys()), 1):
         # Calculate percentage of year (duration / 12 months)
         duration = task1_durations.get(display_name, 0)
         percentage = (duration / 12) * 100
@@ -304,27 +311,17 @@ def create_excel_gantt(df_tasks, output_file):
         # Format as "Task 1 Name (XX%)"
         display_text = f"{display_name} ({percentage:.0f}%)"
         
-        ws_legend.cell(row=i, column=1).value = display_text
+        ws_legend.write_string(i, 0, display_text)
         
         # Color cell based on Display_Name
-        color_cell = ws_legend.cell(row=i, column=2)
-        color_cell.fill = PatternFill(start_color=display_color_map[display_name], 
-                                     end_color=display_color_map[display_name], 
-                                     fill_type="solid")
-    
-    # Auto-adjust column widths
-    for ws_name in [ws, ws_summary, ws_legend]:
-        for col in range(1, ws_name.max_column + 1):
-            max_length = 0
-            for row in range(1, ws_name.max_row + 1):
-                cell = ws_name.cell(row=row, column=col)
-                if cell.value:
-                    max_length = max(max_length, len(str(cell.value)))
-            adjusted_width = max(max_length + 2, 10)
-            ws_name.column_dimensions[get_column_letter(col)].width = adjusted_width
+        ws_legend.write_blank(i, 1, None, bar_fmts[display_color_map[display_name]])
+        legend_texts.append(display_text)
+    
+    # The color column only holds fills, so it keeps the minimum width
+    set_column_widths(ws_legend, [column_width(pd.Series(legend_texts, dtype=object), legend_headers[0]), 10])
     
     # Save the workbook
-    wb.save(output_file)
+    wb.close()
     print(f"Excel Gantt chart saved to {output_file}")
 
 def main():
@@ -340,6 +337,12 @@ def main():
         print("Processing data...")
         df_tasks = process_data_for_gantt(df)
         
+        # Without tasks only the stub sheet is written, so report that instead
+        if df_tasks.empty:
+            create_excel_gantt(df_tasks, args.output)
+            print(f"\nNo task has any month marked (January-December), empty Gantt chart saved to {args.output}")
+            return 0
+        
         # Create Excel Gantt chart
         print(f"Creating Excel Gantt chart and saving to {args.output}...")
         create_excel_gantt(df_tasks, args.output)